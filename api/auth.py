@@ -7,6 +7,7 @@ from fastapi import Depends, HTTPException, Response, status
 from fastapi.routing import APIRouter
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, Field
+from pymongo.errors import DuplicateKeyError
 
 import dependencies
 from resources import users
@@ -27,7 +28,7 @@ class TokenResponse(BaseModel):
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     """Request auth token for user"""
     account = await users.Account.find_one({"email": form_data.username})
-    if account:
+    if account and account.is_active:
         if account.check_password(form_data.password):
             token, exp = account.generate_token()
             return {
@@ -60,13 +61,19 @@ async def create_user(form_data: RegisterUserRequest):
             status_code=status.HTTP_409_CONFLICT,
             detail="User with this email already exists",
         )
-    if re.fullmatch(r'[A-Za-z0-9@#$%^&+=]{8,}', form_data.password):
+    if re.fullmatch(users.PASSWORD_PATTERN, form_data.password):
         new_user = users.Account(
             email=form_data.email,
             full_name=form_data.full_name,
             password=form_data.password,
         )
-        await new_user.insert()
+        try:
+            await new_user.insert()
+        except DuplicateKeyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists",
+            ) from e
         return Response(status_code=status.HTTP_201_CREATED)
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,278 @@
+"""
+    This module contains the admin user management routes for the API.
+"""
+import asyncio
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from beanie import PydanticObjectId
+from bson import ObjectId
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.routing import APIRouter
+from pydantic import BaseModel, Field
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+import dependencies
+from resources import users
+
+router = APIRouter(prefix="/api/users",
+                   tags=["users"],
+                   dependencies=[Depends(dependencies.get_current_admin)])
+
+# Maximum number of accounts accepted by a single bulk request
+MAX_BATCH_SIZE = 1000
+# Bulk create is bounded by bcrypt cost, so it accepts far smaller batches
+MAX_CREATE_BATCH_SIZE = 100
+
+# Dedicated pool for bcrypt so bulk hashing doesn't starve the shared
+# threadpool FastAPI uses for sync routes and dependencies
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                    thread_name_prefix="bcrypt")
+
+
+def _parse_ids(ids: List[str]) -> List[PydanticObjectId]:
+    """Convert account ids to ObjectIds, rejecting malformed ones"""
+    invalid = [i for i in ids if not ObjectId.is_valid(i)]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid account id(s): {', '.join(invalid)}",
+        )
+    return [PydanticObjectId(i) for i in ids]
+
+
+def _set_if_changed(changes: dict, now: datetime) -> List[dict]:
+    """Update pipeline applying changes and bumping updated_at only when a
+    field actually differs, so modified_count reflects real changes"""
+    changed = {
+        "$or": [{
+            "$ne": [f"${key}", {
+                "$literal": value
+            }]
+        } for key, value in changes.items()]
+    }
+    return [{
+        "$set": {
+            **{
+                key: {
+                    "$literal": value
+                } for key, value in changes.items()
+            },
+            "updated_at": {
+                "$cond": [changed, now, "$updated_at"]
+            },
+        }
+    }]
+
+
+class AccountListResponse(BaseModel):
+    """Paginated account list response model"""
+
+    items: List[users.AccountResponse]
+    next_cursor: Optional[str]
+
+
+@router.get("", response_model=AccountListResponse)
+async def list_users(
+    cursor: Optional[str] = Query(
+        None, description="Id of the last account from the previous page"),
+    limit: int = Query(50, ge=1, le=MAX_BATCH_SIZE),
+):
+    """List accounts ordered by id, paginated by cursor"""
+    query = {}
+    if cursor:
+        query["_id"] = {"$gt": _parse_ids([cursor])[0]}
+    # Fetch one extra document to know whether another page exists
+    accounts = await users.Account.find(query).sort("+_id").limit(
+        limit + 1).to_list()
+    next_cursor = None
+    if len(accounts) > limit:
+        accounts = accounts[:limit]
+        next_cursor = str(accounts[-1].id)
+    return {
+        "items": [account.serialize() for account in accounts],
+        "next_cursor": next_cursor,
+    }
+
+
+class BulkCreateRequest(BaseModel):
+    """Request model for creating accounts in bulk"""
+
+    accounts: List[users.AccountCreate] = Field(
+        ..., min_length=1, max_length=MAX_CREATE_BATCH_SIZE)
+
+
+class BulkCreateResponse(BaseModel):
+    """Bulk create response model"""
+
+    inserted_ids: List[str]
+
+
+@router.post("/bulk",
+             response_model=BulkCreateResponse,
+             status_code=status.HTTP_201_CREATED)
+async def bulk_create_users(form_data: BulkCreateRequest):
+    """Create many accounts in a single request
+
+        Returns 409 without creating anything if an email is already registered.
+        If another request creates one of the emails concurrently, the other
+        accounts are still created and the 409 detail lists their
+        `inserted_ids` along with the `failed_emails`.
+    """
+    emails = [account.email for account in form_data.accounts]
+    duplicates = sorted(
+        email for email, count in Counter(emails).items() if count > 1)
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate emails in request: {', '.join(duplicates)}",
+        )
+    weak = [
+        account.email for account in form_data.accounts
+        if not re.fullmatch(users.PASSWORD_PATTERN, account.password)
+    ]
+    if weak:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Password requirements not met for: {', '.join(weak)}",
+        )
+    # Cheap check before hashing; the unique email index covers races
+    existing = await users.Account.find({"email": {"$in": emails}}).to_list()
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Users with these emails already exist: " +
+            ", ".join(sorted(account.email for account in existing)),
+        )
+    # bcrypt releases the GIL, so hashing in the executor runs in parallel
+    loop = asyncio.get_running_loop()
+    hashes = await asyncio.gather(*(loop.run_in_executor(
+        _hash_executor, users.hash_password, account.password)
+                                    for account in form_data.accounts))
+    new_users = [
+        users.Account(
+            email=account.email,
+            full_name=account.full_name,
+            account_type=account.account_type,
+            password=password_hash,
+        ) for account, password_hash in zip(form_data.accounts, hashes)
+    ]
+    try:
+        result = await users.Account.insert_many(new_users, ordered=False)
+    except BulkWriteError as e:
+        # Unordered inserts keep going past duplicates, so every account
+        # except the conflicting ones was created
+        failed = {emails[err["index"]] for err in e.details["writeErrors"]}
+        inserted = await users.Account.find({
+            "email": {
+                "$in": [email for email in emails if email not in failed]
+            }
+        }).to_list()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Users with these emails were created concurrently",
+                "failed_emails": sorted(failed),
+                "inserted_ids": [str(account.id) for account in inserted],
+            },
+        ) from e
+    return {"inserted_ids": [str(i) for i in result.inserted_ids]}
+
+
+class AccountBulkUpdate(users.AccountUpdate):
+    """Account update model identifying the account to update"""
+
+    id: str = Field(..., description="Account id")
+
+
+class BulkUpdateRequest(BaseModel):
+    """Request model for updating accounts in bulk"""
+
+    accounts: List[AccountBulkUpdate] = Field(...,
+                                              min_length=1,
+                                              max_length=MAX_BATCH_SIZE)
+
+
+class BulkDeactivateRequest(BaseModel):
+    """Request model for deactivating accounts in bulk"""
+
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BulkWriteResponse(BaseModel):
+    """Bulk write response model"""
+
+    matched_count: int
+    modified_count: int
+
+
+@router.patch("/bulk", response_model=BulkWriteResponse)
+async def bulk_update_users(
+    form_data: BulkUpdateRequest,
+    admin: users.Account = Depends(dependencies.get_current_admin),
+):
+    """Update many accounts in a single request"""
+    ids = _parse_ids([account.id for account in form_data.accounts])
+    duplicates = sorted(
+        str(object_id) for object_id, count in Counter(ids).items()
+        if count > 1)
+    if duplicates:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate ids in request: {', '.join(duplicates)}",
+        )
+    admin_id = PydanticObjectId(admin.id)
+    for object_id, account in zip(ids, form_data.accounts):
+        if object_id == admin_id and (account.is_active is not None or
+                                      account.account_type is not None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You can't change the status or type of your own "
+                "account",
+            )
+    now = datetime.utcnow()
+    operations = []
+    for object_id, account in zip(ids, form_data.accounts):
+        changes = account.model_dump(mode="json",
+                                     exclude={"id"},
+                                     exclude_none=True)
+        if changes:
+            operations.append(
+                UpdateOne({"_id": object_id}, _set_if_changed(changes, now)))
+    if not operations:
+        return {"matched_count": 0, "modified_count": 0}
+    result = await users.Account.get_motor_collection().bulk_write(
+        operations, ordered=False)
+    return {
+        "matched_count": result.matched_count,
+        "modified_count": result.modified_count,
+    }
+
+
+@router.post("/bulk/deactivate", response_model=BulkWriteResponse)
+async def bulk_deactivate_users(
+    form_data: BulkDeactivateRequest,
+    admin: users.Account = Depends(dependencies.get_current_admin),
+):
+    """Deactivate many accounts in a single request"""
+    ids = _parse_ids(form_data.ids)
+    if PydanticObjectId(admin.id) in ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You can't deactivate your own account",
+        )
+    result = await users.Account.get_motor_collection().update_many(
+        {"_id": {
+            "$in": ids
+        }},
+        _set_if_changed({"is_active": False}, datetime.utcnow()),
+    )
+    return {
+        "matched_count": result.matched_count,
+        "modified_count": result.modified_count,
+    }
@@ -14,7 +14,7 @@ async def get_current_user(token: str = Depends(
     token_scheme)) -> users.Account:
     """Restrict resource to authenticated users"""
     user = await users.Account.check_token(token)
-    if user:
+    if user and user.is_active:
         return user
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -10,7 +10,7 @@ from beanie import init_beanie
 from fastapi import FastAPI
 from fastapi.responses import FileResponse
 
-from api import auth, inventory, oauth
+from api import auth, inventory, oauth, users as users_api
 from database import database
 from resources import lightspeed, users
 
@@ -65,3 +65,4 @@ def render_terms():
 app.include_router(auth.router)
 app.include_router(oauth.router)
 app.include_router(inventory.router)
+app.include_router(users_api.router)
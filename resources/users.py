@@ -6,13 +6,21 @@ from enum import Enum
 from typing import Optional
 
 from bcrypt import checkpw, gensalt, hashpw
-from beanie import Document
+from beanie import Document, Indexed
 from fastapi.encoders import jsonable_encoder
 from jose import jwt
 from pydantic import BaseModel, Field
 
 from config import SECRET_KEY
 
+# Minimum password requirements enforced on account creation
+PASSWORD_PATTERN = r'[A-Za-z0-9@#$%^&+=]{8,}'
+
+
+def hash_password(plain_password: str) -> str:
+    """Return the bcrypt hash of a plain text password"""
+    return hashpw(plain_password.encode(), gensalt()).decode()
+
 
 class Account(Document):
     """Account document model"""
@@ -23,10 +31,11 @@ class Account(Document):
         STREAMER = "streamer"
         ADMIN = "admin"
 
-    email: str = Field(...)
+    email: Indexed(str, unique=True) = Field(...)
     password: Optional[str] = Field(...)
     full_name: str = Field(...)
     account_type: AccountType = Field(AccountType.STREAMER)
+    is_active: bool = Field(True)
     # TODO: Other account related fields ...
     created_at: datetime = Field(datetime.utcnow())
     updated_at: datetime = Field(datetime.utcnow())
@@ -39,11 +48,11 @@ class Account(Document):
             self.id = str(self.id)
         if self.password and not self.password.startswith("$2b$"):
             # Hash the plain text password
-            self.password = hashpw(self.password.encode(), gensalt()).decode()
+            self.password = hash_password(self.password)
 
     async def set_password(self, plain_password: str):
         """Set password hash"""
-        self.password = hashpw(plain_password.encode(), gensalt()).decode()
+        self.password = hash_password(plain_password)
         await self.save()
 
     def check_password(self, plain_password: str) -> bool:
@@ -57,6 +66,7 @@ class Account(Document):
             "email": self.email,
             "full_name": self.full_name,
             "account_type": self.account_type,
+            "is_active": self.is_active,
             "created_at": self.created_at.isoformat(),  #pylint: disable=no-member
             "updated_at": self.updated_at.isoformat(),
         }
@@ -115,6 +125,7 @@ class AccountResponse(BaseModel):
     email: str
     full_name: str
     account_type: Account.AccountType
+    is_active: bool
     created_at: str
     updated_at: str
 
@@ -122,4 +133,6 @@ class AccountResponse(BaseModel):
 class AccountUpdate(BaseModel):
     """Account update model"""
 
-    full_name: str = Field(min_length=3, max_length=50)
+    full_name: Optional[str] = Field(None, min_length=3, max_length=50)
+    account_type: Optional[Account.AccountType] = Field(None)
+    is_active: Optional[bool] = Field(None)
@@ -0,0 +1,232 @@
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from httpx import Client
+from pytest import main as pytest_main
+from pytest import skip
+
+client = Client()
+
+URL_BASE = "http://localhost:8000/api/users"
+AUTH_URL_BASE = "http://localhost:8000/api/auth"
+
+
+def login(email: str, password: str = "Passw0rd"):
+    """Request an auth token"""
+    return client.post(
+        f"{AUTH_URL_BASE}/login",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        content=urlencode({
+            "username": email,
+            "password": password,
+            "grant_type": "password"
+        }))
+
+
+class TestUsers:
+    """Test admin user management"""
+
+    # Get this token from the /api/auth/login endpoint using an admin account
+    # Replace the token below with the one you got from the login endpoint
+    token: str = ""
+
+    def setup_class(self):
+        """Setup"""
+        if not self.token:
+            raise ValueError("Token is required to run this test")
+
+    @property
+    def headers(self) -> dict:
+        """Authorization headers"""
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def create_users(self, count: int = 1) -> list:
+        """Create streamer accounts with unique emails, returns their emails
+        and ids"""
+        emails = [f"staff-{uuid4().hex}@acme.org" for _ in range(count)]
+        res = client.post(f"{URL_BASE}/bulk",
+                          json={
+                              "accounts": [{
+                                  "username": email,
+                                  "password": "Passw0rd",
+                                  "full_name": "Staff Member",
+                              } for email in emails]
+                          },
+                          headers=self.headers)
+        assert res.status_code == 201
+        return list(zip(emails, res.json()["inserted_ids"]))
+
+    def get_own_id(self) -> str:
+        """Get the admin account id"""
+        return client.get(f"{AUTH_URL_BASE}/me",
+                          headers=self.headers).json()["id"]
+
+    def test_list_users(self):
+        """Test list users"""
+        res = client.get(URL_BASE, params={"limit": 1}, headers=self.headers)
+        assert res.status_code == 200
+        assert len(res.json()["items"]) <= 1
+        assert "next_cursor" in res.json()
+
+    def test_list_users_next_page(self):
+        """Test list users with a cursor"""
+        first = client.get(URL_BASE, params={"limit": 1}, headers=self.headers)
+        cursor = first.json()["next_cursor"]
+        if cursor is None:
+            skip("At least two accounts are required to test pagination")
+        res = client.get(URL_BASE,
+                         params={
+                             "limit": 1,
+                             "cursor": cursor
+                         },
+                         headers=self.headers)
+        assert res.status_code == 200
+        assert res.json()["items"][0]["id"] > cursor
+        assert res.json()["items"][0]["id"] != first.json()["items"][-1]["id"]
+
+    def test_list_users_invalid_cursor(self):
+        """Test list users with a malformed cursor"""
+        res = client.get(URL_BASE,
+                         params={"cursor": "not-an-id"},
+                         headers=self.headers)
+        assert res.status_code == 400
+
+    def test_list_users_unauthorized(self):
+        """Test list users without token"""
+        res = client.get(URL_BASE)
+        assert res.status_code == 401
+
+    def test_list_users_forbidden(self):
+        """Test list users with a non admin token"""
+        email, _ = self.create_users()[0]
+        token = login(email).json()["access_token"]
+        res = client.get(URL_BASE,
+                         headers={"Authorization": f"Bearer {token}"})
+        assert res.status_code == 403
+
+    def test_bulk_create_users(self):
+        """Test bulk create users"""
+        created = self.create_users(2)
+        assert len(created) == 2
+        for email, _ in created:
+            assert login(email).status_code == 200
+
+    def test_bulk_create_duplicate_users(self):
+        """Test bulk create with duplicate emails in the request"""
+        account = {
+            "username": "jdoe@acme.org",
+            "password": "Passw0rd",
+            "full_name": "John Doe",
+        }
+        res = client.post(f"{URL_BASE}/bulk",
+                          json={"accounts": [account, account]},
+                          headers=self.headers)
+        assert res.status_code == 400
+
+    def test_bulk_create_existing_user(self):
+        """Test bulk create with an already registered email"""
+        res = client.post(f"{URL_BASE}/bulk",
+                          json={
+                              "accounts": [{
+                                  "username": "jdoe@acme.org",
+                                  "password": "Passw0rd",
+                                  "full_name": "John Doe",
+                              }]
+                          },
+                          headers=self.headers)
+        assert res.status_code == 409
+
+    def test_bulk_update_invalid_id(self):
+        """Test bulk update with a malformed id"""
+        res = client.patch(f"{URL_BASE}/bulk",
+                           json={
+                               "accounts": [{
+                                   "id": "not-an-id",
+                                   "full_name": "John Doe"
+                               }]
+                           },
+                           headers=self.headers)
+        assert res.status_code == 400
+
+    def test_bulk_update_users(self):
+        """Test bulk update users"""
+        (email, user_id), (_, other_id) = self.create_users(2)
+        res = client.patch(f"{URL_BASE}/bulk",
+                           json={
+                               "accounts": [{
+                                   "id": user_id,
+                                   "full_name": "Renamed Member"
+                               }, {
+                                   "id": other_id,
+                                   "full_name": "Staff Member"
+                               }]
+                           },
+                           headers=self.headers)
+        assert res.status_code == 200
+        assert res.json()["matched_count"] == 2
+        # Only the renamed account actually changed
+        assert res.json()["modified_count"] == 1
+        token = login(email).json()["access_token"]
+        me = client.get(f"{AUTH_URL_BASE}/me",
+                        headers={"Authorization": f"Bearer {token}"})
+        assert me.json()["full_name"] == "Renamed Member"
+
+    def test_bulk_update_duplicate_ids(self):
+        """Test bulk update with the same id listed twice"""
+        _, user_id = self.create_users()[0]
+        res = client.patch(f"{URL_BASE}/bulk",
+                           json={
+                               "accounts": [{
+                                   "id": user_id,
+                                   "full_name": "John Doe"
+                               }, {
+                                   "id": user_id.upper(),
+                                   "full_name": "Jane Doe"
+                               }]
+                           },
+                           headers=self.headers)
+        assert res.status_code == 400
+
+    def test_bulk_update_self(self):
+        """Test admin can't demote their own account, whatever the id case"""
+        res = client.patch(f"{URL_BASE}/bulk",
+                           json={
+                               "accounts": [{
+                                   "id": self.get_own_id().upper(),
+                                   "account_type": "streamer"
+                               }]
+                           },
+                           headers=self.headers)
+        assert res.status_code == 400
+
+    def test_bulk_deactivate_users(self):
+        """Test deactivated users can't log in or use existing tokens"""
+        email, user_id = self.create_users()[0]
+        token = login(email).json()["access_token"]
+        res = client.post(f"{URL_BASE}/bulk/deactivate",
+                          json={"ids": [user_id]},
+                          headers=self.headers)
+        assert res.status_code == 200
+        assert res.json()["matched_count"] == 1
+        assert res.json()["modified_count"] == 1
+        assert login(email).status_code == 401
+        me = client.get(f"{AUTH_URL_BASE}/me",
+                        headers={"Authorization": f"Bearer {token}"})
+        assert me.status_code == 401
+
+    def test_bulk_deactivate_self(self):
+        """Test admin can't deactivate their own account"""
+        res = client.post(f"{URL_BASE}/bulk/deactivate",
+                          json={"ids": [self.get_own_id()]},
+                          headers=self.headers)
+        assert res.status_code == 400
+
+    def test_bulk_deactivate_self_upper_case(self):
+        """Test admin can't deactivate their own account with an upper case id"""
+        res = client.post(f"{URL_BASE}/bulk/deactivate",
+                          json={"ids": [self.get_own_id().upper()]},
+                          headers=self.headers)
+        assert res.status_code == 400
+
+if __name__ == "__main__":
+    pytest_main([__file__])